@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 
 class DetectRequest(BaseModel):
     text: str
@@ -20,4 +20,39 @@ class MaskRequest(BaseModel):
 
 class MaskResponse(BaseModel):
     original_text: str
-    masked_text: str
\ No newline at end of file
+    masked_text: str
+
+class AnalyzeRequest(BaseModel):
+    text: str
+
+class AnalyzeResponse(BaseModel):
+    text: str
+    entities: List[Entity]
+    masked_text: str
+    processing_time_ms: float
+
+class BatchDocument(BaseModel):
+    id: str
+    text: str
+
+class BatchDetectRequest(BaseModel):
+    documents: List[BatchDocument]
+
+class BatchDetectResult(BaseModel):
+    id: str
+    entities: Optional[List[Entity]] = None
+    error: Optional[str] = None
+
+class BatchDetectResponse(BaseModel):
+    results: List[BatchDetectResult]
+
+class BatchMaskRequest(BaseModel):
+    documents: List[BatchDocument]
+
+class BatchMaskResult(BaseModel):
+    id: str
+    masked_text: Optional[str] = None
+    error: Optional[str] = None
+
+class BatchMaskResponse(BaseModel):
+    results: List[BatchMaskResult]
\ No newline at end of file
@@ -1,33 +1,159 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from services.model_service import ModelService
-from api.models.schemas import DetectRequest, DetectionResponse, MaskRequest, MaskResponse
+from services.executor import InferenceExecutor
+from services.streaming import ThroughputReporter, iter_line_batches, redact_lines
+from core.config import settings
+from api.models.schemas import (
+    DetectRequest,
+    DetectionResponse,
+    MaskRequest,
+    MaskResponse,
+    AnalyzeRequest,
+    AnalyzeResponse,
+    BatchDetectRequest,
+    BatchDetectResponse,
+    BatchMaskRequest,
+    BatchMaskResponse
+)
 from datetime import datetime, timezone
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 _model_service = None
+_model_state = "not_loaded"  # not_loaded -> loading -> ready | failed
+_model_lock = threading.Lock()
+_executor = None
+
+def load_model_service() -> ModelService:
+    """Build and warm up the shared ModelService exactly once."""
+    global _model_service, _model_state
+    with _model_lock:
+        if _model_service is None:
+            _model_state = "loading"
+            try:
+                service = ModelService()
+                service.warm_up(settings.WARMUP_LENGTHS)
+            except Exception as e:
+                _model_state = "failed"
+                logger.error(f"Model loading failed: {str(e)}")
+                raise
+            _model_service = service
+            _model_state = "ready"
+    return _model_service
+
+def start_model_loading():
+    """Load the model in the background so the app can answer probes meanwhile."""
+    if _model_state == "not_loaded":
+        threading.Thread(target=load_model_service, name="model-warmup", daemon=True).start()
+
+def unload_model_service():
+    global _model_service, _model_state, _executor
+    with _model_lock:
+        if _executor is not None:
+            _executor.shutdown()
+        _executor = None
+        if _model_service is not None:
+            _model_service.close()
+        _model_service = None
+        _model_state = "not_loaded"
+
+def get_inference_executor() -> InferenceExecutor:
+    global _executor
+    if _executor is None:
+        with _model_lock:
+            if _executor is None:
+                _executor = InferenceExecutor(
+                    workers=settings.INFERENCE_WORKERS,
+                    queue_depth=settings.INFERENCE_QUEUE_DEPTH,
+                    torch_threads=settings.TORCH_NUM_THREADS
+                )
+    return _executor
 
 def get_model_service() -> ModelService:
-    global _model_service
+    # Fail fast while the model is loading instead of queueing requests behind it
     if _model_service is None:
-        _model_service = ModelService()
+        start_model_loading()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Model is not ready ({_model_state})",
+            headers={"Retry-After": str(settings.WARMUP_RETRY_AFTER_SECONDS)}
+        )
     return _model_service
 
 @router.post("/detect", response_model=DetectionResponse)
-def detect_text(body: DetectRequest, 
-                model_service: ModelService = Depends(get_model_service)):
-    return model_service.detect_text(body)
+async def detect_text(body: DetectRequest, request: Request,
+                      model_service: ModelService = Depends(get_model_service),
+                      executor: InferenceExecutor = Depends(get_inference_executor)):
+    return await executor.run(request, model_service.detect_text, body)
 
 @router.post("/mask", response_model=MaskResponse)
-def mask_text(body: MaskRequest, 
-                model_service: ModelService = Depends(get_model_service)):
-    return model_service.mask_text(body)
+async def mask_text(body: MaskRequest, request: Request,
+                    model_service: ModelService = Depends(get_model_service),
+                    executor: InferenceExecutor = Depends(get_inference_executor)):
+    return await executor.run(request, model_service.mask_text, body)
+
+@router.post("/analyze", response_model=AnalyzeResponse)
+async def analyze_text(body: AnalyzeRequest, request: Request,
+                       model_service: ModelService = Depends(get_model_service),
+                       executor: InferenceExecutor = Depends(get_inference_executor)):
+    return await executor.run(request, model_service.analyze, body)
+
+@router.post("/detect/batch", response_model=BatchDetectResponse)
+async def detect_batch(body: BatchDetectRequest, request: Request,
+                       model_service: ModelService = Depends(get_model_service),
+                       executor: InferenceExecutor = Depends(get_inference_executor)):
+    return await executor.run(request, model_service.detect_batch, body)
+
+@router.post("/mask/batch", response_model=BatchMaskResponse)
+async def mask_batch(body: BatchMaskRequest, request: Request,
+                     model_service: ModelService = Depends(get_model_service),
+                     executor: InferenceExecutor = Depends(get_inference_executor)):
+    return await executor.run(request, model_service.mask_batch, body)
+
+@router.post("/mask/stream")
+async def mask_stream(request: Request, fields: str = "text", offset: int = 0,
+                      model_service: ModelService = Depends(get_model_service),
+                      executor: InferenceExecutor = Depends(get_inference_executor)):
+    """Redact an NDJSON upload, streaming records back in order as batches finish.
+
+    ``fields`` is a comma-separated list of record fields to mask and
+    ``offset`` skips that many records, to resume after an interruption.
+    """
+    field_list = [field for field in fields.split(",") if field]
+
+    async def generate():
+        reporter = ThroughputReporter("endpoint")
+        async for batch in iter_line_batches(request.stream(), settings.STREAM_BATCH_SIZE, skip=offset):
+            output = await executor.run(
+                request, redact_lines, model_service, batch, field_list, check_disconnect=False
+            )
+            reporter.add(len(batch), sum(len(line) for line in batch))
+            yield output
+        reporter.log(final=True)
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 @router.get("/health")
-async def health_check(model_service: ModelService = Depends(get_model_service)):
-    ready = model_service.is_ready()
+async def health_check():
+    ready = _model_service is not None and _model_service.is_ready()
     return {
         "status": "healthy" if ready else "not_ready",
-        "model_initialized": ready,
+        "model_initialized": _model_service is not None and _model_service.model_initialized,
+        "ready": ready,
+        "model_state": _model_state,
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
+
+@router.get("/health/ready")
+async def readiness_check():
+    # Kubernetes readiness probe: only route traffic once warm-up is done
+    ready = _model_service is not None and _model_service.is_ready()
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"ready": ready, "model_state": _model_state}
+    )
@@ -0,0 +1,133 @@
+"""Throughput and memory of serve.py as the worker count grows.
+
+Starts the pre-fork server for each worker count, drives it with concurrent
+clients for a fixed duration and reports requests/s next to the total PSS
+(proportional set size) of the process tree. PSS splits shared pages between
+the processes that map them, so copy-on-write weights are counted once.
+
+    python -m benchmarks.bench_workers --workers 1 2 4 --duration 20
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ESSAY = (
+    "My name is Aiguo Wagner and I study at Lincoln High. You can reach me at "
+    "aiguo_wagner2235@outlook.gov or 0666 335 6493, or visit 40404 Jeremy Brook. "
+) * 4
+
+
+def _post(url: str, payload: dict, timeout: float = 60):
+    request = urllib.request.Request(
+        url, data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.status
+
+
+def _wait_ready(base_url: str, workers: int, timeout: float = 600):
+    # Consecutive successes so that (very likely) every worker has warmed up
+    deadline, streak = time.monotonic() + timeout, 0
+    while streak < 10 * workers:
+        if time.monotonic() > deadline:
+            raise TimeoutError("server did not become ready")
+        try:
+            with urllib.request.urlopen(f"{base_url}/pii/health/ready", timeout=5):
+                streak += 1
+        except (urllib.error.URLError, ConnectionError):
+            streak = 0
+            time.sleep(0.5)
+
+
+def _tree_pss_bytes(root_pid: int) -> int:
+    pids = [root_pid]
+    children_file = f"/proc/{root_pid}/task/{root_pid}/children"
+    if os.path.exists(children_file):
+        with open(children_file) as f:
+            pids += [int(pid) for pid in f.read().split()]
+    total = 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/smaps_rollup") as f:
+                for line in f:
+                    if line.startswith("Pss:"):
+                        total += int(line.split()[1]) * 1024
+        except OSError:
+            pass
+    return total
+
+
+def run_load(base_url: str, concurrency: int, duration: float) -> dict:
+    stop_at = time.monotonic() + duration
+    completed, errors = [0], [0]
+    lock = threading.Lock()
+
+    def client():
+        while time.monotonic() < stop_at:
+            try:
+                ok = _post(f"{base_url}/pii/detect", {"text": ESSAY}) == 200
+            except (urllib.error.URLError, ConnectionError):
+                ok = False
+            with lock:
+                if ok:
+                    completed[0] += 1
+                else:
+                    errors[0] += 1
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {"requests": completed[0], "errors": errors[0], "rps": completed[0] / duration}
+
+
+def bench(workers: int, port: int, duration: float, concurrency_per_worker: int) -> dict:
+    env = dict(os.environ, CACHE_ENABLED="False")
+    server = subprocess.Popen(
+        [sys.executable, "serve.py", "--workers", str(workers), "--port", str(port)],
+        cwd=APP_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        _wait_ready(base_url, workers)
+        result = run_load(base_url, workers * concurrency_per_worker, duration)
+        result["pss_bytes"] = _tree_pss_bytes(server.pid)
+    finally:
+        server.terminate()
+        server.wait(timeout=60)
+    result["workers"] = workers
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark serve.py throughput against worker count")
+    parser.add_argument('--workers', type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument('--duration', type=float, default=20.0, help="Seconds of load per run")
+    parser.add_argument('--concurrency-per-worker', type=int, default=4)
+    parser.add_argument('--port', type=int, default=30100)
+    parser.add_argument('--memory-limit-gib', type=float, default=3.0, help="Helm chart memory limit")
+    parser.add_argument('--output', type=str, default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = [bench(w, args.port, args.duration, args.concurrency_per_worker) for w in args.workers]
+    limit = args.memory_limit_gib * 1024 ** 3
+    print(f"{'workers':>7} {'req/s':>8} {'errors':>6} {'PSS MiB':>8}  within limit")
+    for r in results:
+        r["within_memory_limit"] = r["pss_bytes"] < limit
+        print(f"{r['workers']:>7} {r['rps']:>8.2f} {r['errors']:>6} {r['pss_bytes'] / 1024 ** 2:>8.0f}  {r['within_memory_limit']}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 import os
+from typing import List
 from dotenv import load_dotenv
 
 
@@ -10,6 +11,63 @@ class Settings(BaseSettings):
     VERSION: str = "1.0.0"
     MODEL_REPO_ID: str = "2phonebabykeem/pii-deberta-v3-base"
     THRESHOLD: float = 0.8
+    AGGREGATION_STRATEGY: str = "first"
+
+    # Load the model from a local artifact built by `python -m services.artifacts`
+    # instead of the Hugging Face Hub. MODEL_OFFLINE forbids any network access.
+    MODEL_LOCAL_PATH: str = ""
+    MODEL_OFFLINE: bool = False
+    MODEL_VERIFY_CHECKSUMS: bool = True
+
+    # Inference backend: "torch-fp32", "torch-dynamic-int8" or "onnxruntime".
+    # ONNX artifacts come from `python -m services.backends`; use
+    # ONNX_FILE_NAME=model_quantized.onnx for the int8 variant.
+    INFERENCE_BACKEND: str = "torch-fp32"
+    ONNX_MODEL_DIR: str = "artifacts/onnx"
+    ONNX_FILE_NAME: str = "model.onnx"
+
+    # Character lengths of the synthetic texts run at startup before the
+    # service reports ready
+    WARMUP_LENGTHS: List[int] = [32, 256, 2048]
+    WARMUP_RETRY_AFTER_SECONDS: int = 5
+
+    # Dedicated inference executor with bounded admission. INFERENCE_WORKERS
+    # should be at least BATCH_MAX_SIZE so the scheduler can fill a batch.
+    # TORCH_NUM_THREADS=0 keeps the torch default.
+    INFERENCE_WORKERS: int = 8
+    INFERENCE_QUEUE_DEPTH: int = 32
+    TORCH_NUM_THREADS: int = 0
+    REQUEST_TIMEOUT_SECONDS: float = 30.0
+    QUEUE_FULL_RETRY_AFTER_SECONDS: int = 1
+
+    # Pre-fork serving (serve.py). 0 derives the worker count from the
+    # container CPU quota; torch threads per worker follow from it.
+    SERVE_WORKERS: int = 0
+
+    # Dynamic micro-batching in front of the NER pipeline
+    BATCH_ENABLED: bool = True
+    BATCH_MAX_WAIT_MS: float = 10.0
+    BATCH_MAX_SIZE: int = 8
+    BATCH_MAX_TOKENS: int = 4096
+
+    # Sliding-window inference for long documents (DeBERTa window is 512 tokens)
+    CHUNK_WINDOW_TOKENS: int = 512
+    CHUNK_OVERLAP_TOKENS: int = 64
+
+    # Content-addressed NER result cache ("memory" or shared "redis")
+    CACHE_ENABLED: bool = True
+    CACHE_BACKEND: str = "memory"
+    CACHE_TTL_SECONDS: float = 3600
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+
+    # Streaming NDJSON redaction (/pii/mask/stream and services.streaming CLI)
+    STREAM_BATCH_SIZE: int = 32
+
+    # Bulk /pii/detect/batch and /pii/mask/batch endpoints
+    BULK_MAX_DOCUMENTS: int = 1000
+    BULK_MAX_TOTAL_CHARS: int = 2_000_000
+    BULK_CHUNK_SIZE: int = 16
 
     # Direct connect to Jaeger Collector
     JAEGER_COLLECTOR_ENDPOINT: str = os.getenv("JAEGER_COLLECTOR_ENDPOINT", "http://localhost:4317")
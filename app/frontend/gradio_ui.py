@@ -6,7 +6,8 @@ import argparse
 def get_urls(base_url: str):
     return {
         "detect": f"{base_url}/api/pii/detect",
-        "mask": f"{base_url}/api/pii/mask"
+        "mask": f"{base_url}/api/pii/mask",
+        "analyze": f"{base_url}/api/pii/analyze"
     }
 
 def ner_via_api(text: str, urls: dict):
@@ -15,34 +16,43 @@ def ner_via_api(text: str, urls: dict):
         return response.json()
     return {"text": text, "entities": []}
 
+def highlight_masked_text(masked_text: str):
+    # Color mapping
+    color_map = {
+        "EMAIL": "#ff6b6b",
+        "STREET_ADDRESS": "#4ecdc4", 
+        "PHONE_NUM": "#45b7d1",
+        "ID_NUM": "#9b59b6",
+        "NAME_STUDENT": "#f39c12",
+        "URL_PERSONAL": "#e67e22",
+        "USERNAME": "#8b4513"
+    }
+    
+    # Replace masked tokens with colored HTML
+    highlighted_text = masked_text
+    for label, color in color_map.items():
+        pattern = f"\\[{label}\\]"
+        replacement = f'<span style="background-color: {color}; padding: 2px 4px; border-radius: 3px; color: white; font-weight: bold;">[{label}]</span>'
+        highlighted_text = re.sub(pattern, replacement, highlighted_text)
+    
+    return highlighted_text
+
 def mask_with_html_highlight(text: str, urls: dict):
     response = requests.post(urls["mask"], json={"text": text})
     if response.status_code == 200:
         data = response.json()
-        masked_text = data.get("masked_text", text)
-        
-        # Color mapping
-        color_map = {
-            "EMAIL": "#ff6b6b",
-            "STREET_ADDRESS": "#4ecdc4", 
-            "PHONE_NUM": "#45b7d1",
-            "ID_NUM": "#9b59b6",
-            "NAME_STUDENT": "#f39c12",
-            "URL_PERSONAL": "#e67e22",
-            "USERNAME": "#8b4513"
-        }
-        
-        # Replace masked tokens with colored HTML
-        highlighted_text = masked_text
-        for label, color in color_map.items():
-            pattern = f"\\[{label}\\]"
-            replacement = f'<span style="background-color: {color}; padding: 2px 4px; border-radius: 3px; color: white; font-weight: bold;">[{label}]</span>'
-            highlighted_text = re.sub(pattern, replacement, highlighted_text)
-        
-        return highlighted_text
+        return highlight_masked_text(data.get("masked_text", text))
     else:
         return text
 
+def analyze_via_api(text: str, urls: dict):
+    # One model run for both the entity list and the masked text
+    response = requests.post(urls["analyze"], json={"text": text})
+    if response.status_code == 200:
+        data = response.json()
+        return data, highlight_masked_text(data.get("masked_text", text))
+    return {"text": text, "entities": []}, text
+
 def gradio_launch(urls: dict):
     with gr.Blocks(title="PII Detector") as demo:
         gr.Markdown("# 🕵️ Education PII Detector")
@@ -93,6 +103,26 @@ def gradio_launch(urls: dict):
                 """
             )
 
+        with gr.Tab("🛡️ Detect & Mask"):
+            with gr.Row():
+                with gr.Column():
+                    analyze_input = gr.Textbox(
+                        label="Enter text",
+                        placeholder="Type or paste text with PII...",
+                        lines=10
+                    )
+                    analyze_btn = gr.Button("🛡️ Detect & Mask", variant="primary")
+                with gr.Column():
+                    analyze_entities = gr.HighlightedText(label="Detection Results")
+                    gr.Markdown("### 🛡️ Masked Results")
+                    analyze_masked = gr.HTML()
+
+            analyze_btn.click(
+                lambda t: analyze_via_api(t, urls),
+                inputs=analyze_input,
+                outputs=[analyze_entities, analyze_masked]
+            )
+
     demo.launch()
 
 def main():
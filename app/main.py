@@ -3,6 +3,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from core.config import settings
 from api.routes import api_router
+from api.routes.pii_router import start_model_loading, unload_model_service
 import logging
 from utils.tracer import setup_tracing, remove_tracing
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
@@ -35,10 +36,16 @@ async def lifespan(app: FastAPI):
     instrumentator.expose(app)
     logger.info("Exposing metrics successfully")
 
+    # Load and warm up the model without blocking startup; requests get a
+    # 503 until it is ready
+    logger.info("Loading and warming up NER model in background...")
+    start_model_loading()
+
     yield
 
     # Shutdown
     logger.info("Cleaning up resources...")
+    unload_model_service()
     
     # Release GPU
     gc.collect()
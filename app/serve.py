@@ -0,0 +1,142 @@
+import argparse
+import gc
+import logging
+import math
+import os
+import signal
+import socket
+import sys
+import tempfile
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+)
+logger = logging.getLogger("serve")
+
+
+def cpu_quota() -> float:
+    """CPUs available to the container, from the cgroup quota if one is set."""
+    # cgroup v2
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            return int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    # cgroup v1
+    try:
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+            quota = int(f.read())
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+            period = int(f.read())
+        if quota > 0:
+            return quota / period
+    except (OSError, ValueError):
+        pass
+    return float(len(os.sched_getaffinity(0)))
+
+
+def plan_workers(requested: int, cpus: float):
+    """Return (workers, torch threads per worker) for the available CPUs."""
+    workers = requested if requested > 0 else max(1, math.floor(cpus))
+    threads = max(1, math.floor(cpus / workers))
+    return workers, threads
+
+
+def _run_worker(sock: socket.socket, torch_threads: int):
+    import torch
+    import uvicorn
+    from core.config import settings
+    from main import app
+
+    # Each worker gets its share of the CPU quota instead of torch's default
+    # of one thread per visible core, which oversubscribes the container
+    settings.TORCH_NUM_THREADS = settings.TORCH_NUM_THREADS or torch_threads
+    torch.set_num_threads(settings.TORCH_NUM_THREADS)
+    uvicorn.Server(uvicorn.Config(app, log_level="info")).run(sockets=[sock])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-fork server sharing one copy of the model weights")
+    parser.add_argument('--host', type=str, default="0.0.0.0", help="Bind address")
+    parser.add_argument('--port', type=int, default=30000, help="Bind port")
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help="Worker processes (default: SERVE_WORKERS, or the CPU quota when 0)"
+    )
+    args = parser.parse_args()
+
+    # Settings are read before anything imports prometheus_client, which
+    # must see PROMETHEUS_MULTIPROC_DIR at import time
+    from core.config import settings
+    requested = args.workers if args.workers is not None else settings.SERVE_WORKERS
+    workers, torch_threads = plan_workers(requested, cpu_quota())
+    if workers > 1 and "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="pii-metrics-")
+    # Tokenizers' Rust thread pool is not fork-safe once used
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+    logger.info(f"Starting {workers} worker(s) with {torch_threads} torch thread(s) each")
+
+    # Load the weights once; children inherit them copy-on-write. No
+    # inference runs here, so torch's thread pools are created after fork.
+    from services.model_service import preload_pipeline
+    preload_pipeline()
+    # Keep the garbage collector from touching (and so copying) inherited objects
+    gc.freeze()
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((args.host, args.port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+
+    children = set()
+    shutting_down = False
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            try:
+                _run_worker(sock, torch_threads)
+            finally:
+                os._exit(0)
+        children.add(pid)
+
+    def stop(signum, _frame):
+        nonlocal shutting_down
+        shutting_down = True
+        for pid in children:
+            os.kill(pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(workers):
+        spawn()
+
+    # Supervise: restart crashed workers until asked to stop
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        children.discard(pid)
+        if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+            from prometheus_client import multiprocess
+            multiprocess.mark_process_dead(pid)
+        if not shutting_down:
+            logger.warning(f"Worker {pid} exited with status {status}, restarting")
+            spawn()
+    sys.exit(0)
+
+if __name__ == "__main__":
+    main()
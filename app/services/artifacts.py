@@ -0,0 +1,132 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from transformers import AutoModelForTokenClassification, AutoTokenizer
+from core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+LATEST_FILE = "LATEST"
+
+
+class ArtifactIntegrityError(RuntimeError):
+    pass
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def snapshot_model(model_id: str, output_root: str, safetensors: bool = True) -> str:
+    """Save model and tokenizer into ``output_root/<model>/<version>``.
+
+    The version is derived from the file hashes, so re-running the command
+    for unchanged weights is a no-op. Safetensors weights are memory-mapped
+    by transformers at load time instead of being unpickled and copied.
+    """
+    model_dir = os.path.join(output_root, model_id.replace("/", "--"))
+    os.makedirs(model_dir, exist_ok=True)
+    staging = tempfile.mkdtemp(dir=model_dir, prefix=".staging-")
+    try:
+        logger.info(f"Downloading {model_id}")
+        model = AutoModelForTokenClassification.from_pretrained(model_id)
+        model.save_pretrained(staging, safe_serialization=safetensors)
+        AutoTokenizer.from_pretrained(model_id).save_pretrained(staging)
+
+        files = {
+            name: {"sha256": _sha256(os.path.join(staging, name)),
+                   "size": os.path.getsize(os.path.join(staging, name))}
+            for name in sorted(os.listdir(staging))
+        }
+        version = hashlib.sha256(
+            json.dumps(files, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:12]
+        manifest = {
+            "model_id": model_id,
+            "version": version,
+            "format": "safetensors" if safetensors else "pytorch",
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "files": files
+        }
+        with open(os.path.join(staging, MANIFEST_FILE), "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        version_dir = os.path.join(model_dir, version)
+        if os.path.exists(version_dir):
+            logger.info(f"Artifact {version} already exists")
+        else:
+            os.rename(staging, version_dir)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    with open(os.path.join(model_dir, LATEST_FILE), "w") as f:
+        f.write(version)
+    logger.info(f"Model artifact written to {version_dir}")
+    return version_dir
+
+
+def resolve_artifact(path: str, verify_hashes: bool = True) -> str:
+    """Return the version directory for ``path`` after checking its manifest.
+
+    ``path`` may be a version directory or a model directory with a LATEST
+    pointer. File sizes are always checked; full SHA-256 verification reads
+    every byte and can be turned off when startup time matters more.
+    """
+    latest = os.path.join(path, LATEST_FILE)
+    if os.path.exists(latest):
+        with open(latest) as f:
+            path = os.path.join(path, f.read().strip())
+
+    manifest_path = os.path.join(path, MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        raise ArtifactIntegrityError(f"No {MANIFEST_FILE} found in {path}")
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+
+    for name, expected in manifest["files"].items():
+        file_path = os.path.join(path, name)
+        if not os.path.exists(file_path):
+            raise ArtifactIntegrityError(f"Artifact file {name} is missing")
+        if os.path.getsize(file_path) != expected["size"]:
+            raise ArtifactIntegrityError(f"Artifact file {name} has an unexpected size")
+        if verify_hashes and _sha256(file_path) != expected["sha256"]:
+            raise ArtifactIntegrityError(f"Artifact file {name} failed its checksum")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snapshot the PII model into a local artifact directory")
+    parser.add_argument(
+        '--model',
+        type=str,
+        default=settings.MODEL_REPO_ID,
+        help="Hugging Face repo id of the model"
+    )
+    parser.add_argument(
+        '--output',
+        type=str,
+        default="artifacts/models",
+        help="Root directory for versioned model artifacts"
+    )
+    parser.add_argument(
+        '--no-safetensors',
+        action="store_true",
+        help="Keep PyTorch pickle weights instead of converting to safetensors"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    print(snapshot_model(args.model, args.output, safetensors=not args.no_safetensors))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import argparse
+import logging
+import os
+from transformers import AutoModelForTokenClassification, AutoTokenizer, pipeline
+import torch
+from core.config import settings
+
+try:
+    from optimum.onnxruntime import ORTModelForTokenClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except ImportError:  # optional, only needed for INFERENCE_BACKEND=onnxruntime
+    ORTModelForTokenClassification = None
+
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("torch-fp32", "torch-dynamic-int8", "onnxruntime")
+
+ONNX_FP32_FILE = "model.onnx"
+ONNX_INT8_FILE = "model_quantized.onnx"
+
+
+def _require_onnxruntime():
+    if ORTModelForTokenClassification is None:
+        raise RuntimeError(
+            "The onnxruntime backend requires 'optimum[onnxruntime]' to be installed"
+        )
+
+
+def load_model(backend: str, model_id: str, local_files_only: bool = False):
+    """Load the token classification model for ``backend``.
+
+    Every backend returns a model that plugs into the same Hugging Face
+    pipeline, so tokenization, aggregation and our own post-processing
+    stay identical whichever one is selected.
+    """
+    if backend == "torch-fp32":
+        return AutoModelForTokenClassification.from_pretrained(
+            model_id, torch_dtype=torch.float32, local_files_only=local_files_only
+        )
+
+    if backend == "torch-dynamic-int8":
+        model = AutoModelForTokenClassification.from_pretrained(
+            model_id, torch_dtype=torch.float32, local_files_only=local_files_only
+        )
+        # Weights of every Linear layer are stored as int8, activations are
+        # quantized on the fly; embeddings and layer norms stay fp32
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    if backend == "onnxruntime":
+        _require_onnxruntime()
+        return ORTModelForTokenClassification.from_pretrained(
+            settings.ONNX_MODEL_DIR, file_name=settings.ONNX_FILE_NAME
+        )
+
+    raise ValueError(f"Unknown INFERENCE_BACKEND: {backend}, expected one of {BACKENDS}")
+
+
+def load_pipeline(backend: str = None, model_id: str = None, local_files_only: bool = False):
+    backend = backend or settings.INFERENCE_BACKEND
+    model_id = model_id or settings.MODEL_REPO_ID
+    # The ONNX artifact directory is self-contained, including the tokenizer
+    tokenizer_id = settings.ONNX_MODEL_DIR if backend == "onnxruntime" else model_id
+    return pipeline(
+        "ner",
+        model=load_model(backend, model_id, local_files_only),
+        tokenizer=AutoTokenizer.from_pretrained(tokenizer_id, local_files_only=local_files_only),
+        aggregation_strategy=settings.AGGREGATION_STRATEGY,
+        device="cpu"
+    )
+
+
+def export_onnx(model_id: str, output_dir: str, quantize: bool = True):
+    """Export ``model_id`` to ONNX and optionally add a dynamic int8 variant."""
+    _require_onnxruntime()
+    os.makedirs(output_dir, exist_ok=True)
+
+    logger.info(f"Exporting {model_id} to ONNX in {output_dir}")
+    model = ORTModelForTokenClassification.from_pretrained(model_id, export=True)
+    model.save_pretrained(output_dir)
+    AutoTokenizer.from_pretrained(model_id).save_pretrained(output_dir)
+
+    if quantize:
+        logger.info("Quantizing ONNX model to dynamic int8")
+        quantizer = ORTQuantizer.from_pretrained(output_dir, file_name=ONNX_FP32_FILE)
+        qconfig = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+        quantizer.quantize(save_dir=output_dir, quantization_config=qconfig)
+    return output_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the PII model to ONNX Runtime artifacts")
+    parser.add_argument(
+        '--model',
+        type=str,
+        default=settings.MODEL_REPO_ID,
+        help="Hugging Face repo id or local path of the model"
+    )
+    parser.add_argument(
+        '--output',
+        type=str,
+        default=settings.ONNX_MODEL_DIR,
+        help=f"Directory to write {ONNX_FP32_FILE}, {ONNX_INT8_FILE} and the tokenizer"
+    )
+    parser.add_argument(
+        '--no-quantize',
+        action="store_true",
+        help="Only export the fp32 ONNX model"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    export_onnx(args.model, args.output, quantize=not args.no_quantize)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from core.config import settings
+from utils.metrics import CACHE_HITS, CACHE_MISSES, CACHE_EVICTIONS
+
+try:
+    import redis
+except ImportError:  # optional, only needed for CACHE_BACKEND=redis
+    redis = None
+
+
+logger = logging.getLogger(__name__)
+
+# Rough per-entry bookkeeping cost (key string, OrderedDict node, tuple)
+_ENTRY_OVERHEAD_BYTES = 200
+
+
+class ResultCache:
+    """Content-addressed cache of NER predictions.
+
+    Keys are a SHA-256 of the stripped text plus everything that changes
+    the model output, so the raw text never leaves the process. Values
+    only hold labels, scores and offsets (relative to the stripped text);
+    the matched words are rebuilt from the caller's text on a hit, so no
+    PII is stored either.
+    """
+
+    backend = "none"
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+
+    def _key(self, text: str) -> str:
+        digest = hashlib.sha256(f"{self.namespace}\0{text.strip()}".encode("utf-8")).hexdigest()
+        return f"pii:ner:{digest}"
+
+    @staticmethod
+    def _encode(text: str, preds: list) -> str:
+        lead = len(text) - len(text.lstrip())
+        return json.dumps([
+            [pred["entity_group"], float(pred["score"]), pred["start"] - lead, pred["end"] - lead]
+            for pred in preds
+        ], separators=(",", ":"))
+
+    @staticmethod
+    def _decode(text: str, payload: str) -> list:
+        lead = len(text) - len(text.lstrip())
+        return [
+            {
+                "entity_group": label,
+                "score": score,
+                "word": text[start + lead:end + lead],
+                "start": start + lead,
+                "end": end + lead
+            }
+            for label, score, start, end in json.loads(payload)
+        ]
+
+    def _load(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def _store(self, key: str, payload: str):
+        raise NotImplementedError
+
+    def get(self, text: str) -> Optional[list]:
+        payload = self._load(self._key(text))
+        if payload is None:
+            CACHE_MISSES.labels(backend=self.backend).inc()
+            return None
+        CACHE_HITS.labels(backend=self.backend).inc()
+        return self._decode(text, payload)
+
+    def put(self, text: str, preds: list) -> list:
+        """Store predictions and return them in the same form a hit would."""
+        payload = self._encode(text, preds)
+        self._store(self._key(text), payload)
+        return self._decode(text, payload)
+
+
+class MemoryResultCache(ResultCache):
+    """Thread-safe LRU with a TTL and a memory budget in bytes."""
+
+    backend = "memory"
+
+    def __init__(self, namespace: str, max_bytes: int, ttl_seconds: float):
+        super().__init__(namespace)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.size_bytes = 0
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _entry_size(key: str, payload: str) -> int:
+        return len(key) + len(payload) + _ENTRY_OVERHEAD_BYTES
+
+    def _pop(self, key: str, reason: str):
+        _, payload = self._entries.pop(key)
+        self.size_bytes -= self._entry_size(key, payload)
+        CACHE_EVICTIONS.labels(backend=self.backend, reason=reason).inc()
+
+    def _load(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at < time.monotonic():
+                self._pop(key, "ttl")
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def _store(self, key: str, payload: str):
+        size = self._entry_size(key, payload)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                _, old = self._entries.pop(key)
+                self.size_bytes -= self._entry_size(key, old)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, payload)
+            self.size_bytes += size
+            while self.size_bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)), "size")
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisResultCache(ResultCache):
+    """Shared cache so replicas reuse each other's results.
+
+    Expiry is handled by Redis TTLs and its own maxmemory policy. Cache
+    errors are logged and treated as misses so Redis is never on the
+    critical path.
+    """
+
+    backend = "redis"
+
+    def __init__(self, namespace: str, url: str, ttl_seconds: float):
+        if redis is None:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package")
+        super().__init__(namespace)
+        self.ttl_seconds = int(ttl_seconds)
+        self.client = redis.Redis.from_url(url, socket_timeout=0.05)
+
+    def _load(self, key: str) -> Optional[str]:
+        try:
+            payload = self.client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Result cache lookup failed: {str(e)}")
+            return None
+        return payload.decode("utf-8") if payload is not None else None
+
+    def _store(self, key: str, payload: str):
+        try:
+            self.client.set(key, payload, ex=self.ttl_seconds)
+        except redis.RedisError as e:
+            logger.warning(f"Result cache store failed: {str(e)}")
+
+
+def build_result_cache(model_id: str) -> Optional[ResultCache]:
+    if not settings.CACHE_ENABLED:
+        return None
+
+    namespace = (
+        f"{model_id}|{settings.INFERENCE_BACKEND}|"
+        f"{settings.AGGREGATION_STRATEGY}|{settings.THRESHOLD}"
+    )
+    if settings.CACHE_BACKEND == "memory":
+        return MemoryResultCache(namespace, settings.CACHE_MAX_BYTES, settings.CACHE_TTL_SECONDS)
+    if settings.CACHE_BACKEND == "redis":
+        return RedisResultCache(namespace, settings.CACHE_REDIS_URL, settings.CACHE_TTL_SECONDS)
+    raise ValueError(f"Unknown CACHE_BACKEND: {settings.CACHE_BACKEND}")
@@ -0,0 +1,58 @@
+from typing import List, Sequence, Tuple
+
+# Character span (start, end) of one inference window inside a document
+Window = Tuple[int, int]
+
+
+def split_windows(offsets: Sequence[Tuple[int, int]], text_length: int,
+                  window_tokens: int, overlap_tokens: int) -> List[Window]:
+    """Split a document into overlapping token windows.
+
+    ``offsets`` is the tokenizer offset mapping of the document without
+    special tokens. Each window holds at most ``window_tokens`` tokens and
+    shares ``overlap_tokens`` tokens with its neighbour, so work grows
+    linearly with document length instead of quadratically.
+    """
+    if len(offsets) <= window_tokens:
+        return [(0, text_length)]
+
+    step = max(1, window_tokens - overlap_tokens)
+    windows = []
+    for first in range(0, len(offsets), step):
+        last = min(first + window_tokens, len(offsets)) - 1
+        start = 0 if first == 0 else offsets[first][0]
+        end = text_length if last == len(offsets) - 1 else offsets[last][1]
+        windows.append((start, end))
+        if last == len(offsets) - 1:
+            break
+    return windows
+
+
+def merge_window_predictions(windows: List[Window], window_preds: List[list]) -> list:
+    """Merge per-window predictions back into document-level offsets.
+
+    A prediction is kept only by the window that owns its start character,
+    where ownership switches halfway through each overlap. Any predictions
+    that still overlap are de-duplicated by keeping the higher score.
+    """
+    if len(windows) == 1:
+        return list(window_preds[0])
+
+    merged = []
+    for k, ((start, end), preds) in enumerate(zip(windows, window_preds)):
+        owned_from = 0 if k == 0 else (start + windows[k - 1][1]) // 2
+        owned_to = end if k == len(windows) - 1 else (windows[k + 1][0] + end) // 2
+        for pred in preds:
+            shifted = dict(pred, start=pred["start"] + start, end=pred["end"] + start)
+            if owned_from <= shifted["start"] < owned_to:
+                merged.append(shifted)
+
+    merged.sort(key=lambda p: (p["start"], p["end"]))
+    deduped = []
+    for pred in merged:
+        if deduped and pred["start"] < deduped[-1]["end"]:
+            if pred["score"] > deduped[-1]["score"]:
+                deduped[-1] = pred
+            continue
+        deduped.append(pred)
+    return deduped
@@ -0,0 +1,129 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+from fastapi import HTTPException, Request, status
+import torch
+from core.config import settings
+from utils.metrics import INFERENCE_QUEUED, INFERENCE_RUNNING, INFERENCE_REJECTIONS
+
+
+logger = logging.getLogger(__name__)
+
+# Not an official status code; nginx uses it for "client closed request"
+HTTP_499_CLIENT_CLOSED_REQUEST = 499
+
+# How often a waiting request checks whether its client is still connected
+_DISCONNECT_POLL_SECONDS = 0.25
+
+
+class _DeadlineExceeded(Exception):
+    pass
+
+
+class InferenceExecutor:
+    """Runs blocking inference on a dedicated, sized thread pool.
+
+    Admission is bounded: at most ``workers`` calls run while up to
+    ``queue_depth`` more wait. Anything beyond that is rejected with a fast
+    429 instead of piling up in Starlette's shared threadpool. Queued work
+    is dropped once its deadline passes or its client disconnects.
+    """
+
+    def __init__(self, workers: int, queue_depth: int, torch_threads: int = 0):
+        if torch_threads > 0:
+            torch.set_num_threads(torch_threads)
+        self.workers = workers
+        self.capacity = workers + queue_depth
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="inference")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+
+    def _update_gauges(self):
+        INFERENCE_RUNNING.set(self._running)
+        INFERENCE_QUEUED.set(self._pending - self._running)
+
+    def _release(self, _future: Future):
+        with self._lock:
+            self._pending -= 1
+            self._update_gauges()
+
+    def _call(self, deadline: float, fn: Callable, *args):
+        # Work that waited past its deadline is skipped, not run for nobody
+        if time.monotonic() > deadline:
+            raise _DeadlineExceeded()
+        with self._lock:
+            self._running += 1
+            self._update_gauges()
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._update_gauges()
+
+    def _reject(self, reason: str, status_code: int, detail: str, retry_after: Optional[int] = None):
+        INFERENCE_REJECTIONS.labels(reason=reason).inc()
+        headers = {"Retry-After": str(retry_after)} if retry_after is not None else None
+        raise HTTPException(status_code=status_code, detail=detail, headers=headers)
+
+    @staticmethod
+    def deadline_for(request: Request) -> float:
+        """Server deadline, optionally shortened by an ``X-Request-Timeout-Ms`` header."""
+        timeout = settings.REQUEST_TIMEOUT_SECONDS
+        header = request.headers.get("x-request-timeout-ms")
+        if header:
+            try:
+                timeout = min(timeout, max(0.0, float(header) / 1000))
+            except ValueError:
+                pass
+        return time.monotonic() + timeout
+
+    async def run(self, request: Request, fn: Callable, *args, check_disconnect: bool = True):
+        with self._lock:
+            if self._pending >= self.capacity:
+                admitted = False
+            else:
+                admitted = True
+                self._pending += 1
+                self._update_gauges()
+        if not admitted:
+            self._reject(
+                "queue_full",
+                status.HTTP_429_TOO_MANY_REQUESTS,
+                "Inference queue is full",
+                retry_after=settings.QUEUE_FULL_RETRY_AFTER_SECONDS
+            )
+
+        deadline = self.deadline_for(request)
+        future = self._pool.submit(self._call, deadline, fn, *args)
+        future.add_done_callback(self._release)
+        waiter = asyncio.wrap_future(future)
+        # Results of abandoned requests are never awaited; mark them retrieved
+        waiter.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                future.cancel()
+                self._reject("deadline", status.HTTP_504_GATEWAY_TIMEOUT, "Request deadline exceeded")
+            done, _ = await asyncio.wait({waiter}, timeout=min(remaining, _DISCONNECT_POLL_SECONDS))
+            if done:
+                break
+            # Polling for a disconnect reads from the request, so streaming
+            # handlers that are still consuming the body opt out
+            if check_disconnect and await request.is_disconnected():
+                future.cancel()
+                logger.info("Client disconnected, dropping queued inference")
+                self._reject("disconnected", HTTP_499_CLIENT_CLOSED_REQUEST, "Client closed request")
+
+        try:
+            return waiter.result()
+        except _DeadlineExceeded:
+            self._reject("deadline", status.HTTP_504_GATEWAY_TIMEOUT, "Request deadline exceeded")
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -4,16 +4,33 @@ from api.models.schemas import (
     Entity, 
     DetectionResponse, 
     MaskRequest, 
-    MaskResponse
+    MaskResponse,
+    AnalyzeRequest,
+    AnalyzeResponse,
+    BatchDocument,
+    BatchDetectRequest,
+    BatchDetectResult,
+    BatchDetectResponse,
+    BatchMaskRequest,
+    BatchMaskResult,
+    BatchMaskResponse
 )
 import logging
 from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
 import time
+import queue
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from transformers import pipeline
-import torch
+from typing import List, Optional, Union
 from core.config import settings
+from utils.metrics import BATCH_SIZE, BATCH_QUEUE_WAIT, MODEL_LOAD_SECONDS, MODEL_WARMUP_SECONDS
+from services.chunking import Window, split_windows, merge_window_predictions
+from services.cache import build_result_cache
+from services.backends import load_pipeline
+from services.artifacts import resolve_artifact
 
 
 logging.basicConfig(
@@ -22,27 +39,171 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@dataclass
+class _BatchItem:
+    text: str
+    tokens: int
+    enqueued_at: float
+    future: Future
+
+
+class BatchScheduler:
+    """Collects concurrent NER requests and runs them as one padded forward pass.
+
+    Callers block on a future while a single worker thread drains the queue,
+    waiting at most ``max_wait_ms`` for more texts to arrive and closing the
+    batch early once ``max_batch_size`` or the padded ``max_batch_tokens``
+    budget is reached.
+    """
+
+    def __init__(self, ner_pipeline, max_wait_ms: float, max_batch_size: int, max_batch_tokens: int):
+        self.ner_pipeline = ner_pipeline
+        self.max_wait = max_wait_ms / 1000
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_batch_tokens = max_batch_tokens
+        self._queue: "queue.Queue[Optional[_BatchItem]]" = queue.Queue()
+        self._carry: Optional[_BatchItem] = None
+        self._worker = threading.Thread(target=self._run, name="ner-batch-scheduler", daemon=True)
+        self._worker.start()
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        # Rough sentencepiece estimate (~4 chars per token) plus [CLS]/[SEP];
+        # only used for batch budgeting, never for truncation.
+        return len(text) // 4 + 2
+
+    def submit(self, text: str) -> Future:
+        future = Future()
+        self._queue.put(_BatchItem(text, self.estimate_tokens(text), time.monotonic(), future))
+        return future
+
+    def __call__(self, text: str):
+        return self.submit(text).result()
+
+    def close(self):
+        self._queue.put(None)
+        self._worker.join(timeout=5)
+
+    def _next_batch(self) -> Optional[List[_BatchItem]]:
+        first = self._carry or self._queue.get()
+        self._carry = None
+        if first is None:
+            return None
+
+        batch = [first]
+        longest = first.tokens
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                # Flush what we have, stop on the next round
+                self._queue.put(None)
+                break
+            # Padded cost: every row is as long as the longest text in the batch
+            if max(longest, item.tokens) * (len(batch) + 1) > self.max_batch_tokens:
+                self._carry = item
+                break
+            batch.append(item)
+            longest = max(longest, item.tokens)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+
+            now = time.monotonic()
+            batch = [item for item in batch if item.future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            for item in batch:
+                BATCH_QUEUE_WAIT.observe(now - item.enqueued_at)
+            BATCH_SIZE.observe(len(batch))
+
+            try:
+                results = self.ner_pipeline([item.text for item in batch], batch_size=len(batch))
+            except Exception as e:
+                for item in batch:
+                    item.future.set_exception(e)
+                continue
+            for item, preds in zip(batch, results):
+                item.future.set_result(preds)
+
+
+_preloaded = None
+
+
+def _load_pipeline_from_settings():
+    start_time = time.perf_counter()
+    model_source, source = settings.MODEL_REPO_ID, "hub"
+    if settings.MODEL_LOCAL_PATH:
+        model_source = resolve_artifact(
+            settings.MODEL_LOCAL_PATH, verify_hashes=settings.MODEL_VERIFY_CHECKSUMS
+        )
+        source = "local"
+    ner_pipeline = load_pipeline(
+        settings.INFERENCE_BACKEND,
+        model_source,
+        local_files_only=settings.MODEL_OFFLINE or source == "local"
+    )
+    load_seconds = time.perf_counter() - start_time
+    MODEL_LOAD_SECONDS.labels(source=source).set(load_seconds)
+    logger.info(f"Loaded NER pipeline from {source} in {load_seconds:.1f} s")
+    return ner_pipeline, model_source, source
+
+
+def preload_pipeline():
+    """Load the pipeline once in a parent process before forking workers.
+
+    Every ModelService created afterwards, including in forked children,
+    reuses these weights, so N workers share one copy-on-write copy.
+    """
+    global _preloaded
+    if _preloaded is None:
+        _preloaded = _load_pipeline_from_settings()
+
+
 class ModelService:
     def __init__(self):
         self.tracer = trace.get_tracer(__name__)
         self.model_initialized = False
+        self.warmed_up = False
         self._initialize_model()
 
     def _initialize_model(self):
         with self.tracer.start_as_current_span("pii_model_initialization") as span:
             # Load PII NER pipeline
             try:
-                self.ner_pipeline = pipeline(
-                    "ner",
-                    model=settings.MODEL_REPO_ID, 
-                    tokenizer=settings.MODEL_REPO_ID,
-                    aggregation_strategy="first" ,
-                    device="cpu",
-                    torch_dtype=torch.float32
-                )
+                if _preloaded is not None:
+                    # Weights were loaded by the pre-fork parent (see serve.py)
+                    self.ner_pipeline, model_source, source = _preloaded
+                    span.set_attribute("model.preloaded", True)
+                else:
+                    self.ner_pipeline, model_source, source = _load_pipeline_from_settings()
+                span.set_attribute("model.source", source)
                 span.set_attribute("model.type", "pii_token_classification_pipeline")
+                span.set_attribute("model.backend", settings.INFERENCE_BACKEND)
                 span.set_attribute("model.initialization.success", True)
                 self.model_initialized = True
+                self.batch_scheduler = None
+                if settings.BATCH_ENABLED:
+                    self.batch_scheduler = BatchScheduler(
+                        self.ner_pipeline,
+                        max_wait_ms=settings.BATCH_MAX_WAIT_MS,
+                        max_batch_size=settings.BATCH_MAX_SIZE,
+                        max_batch_tokens=settings.BATCH_MAX_TOKENS
+                    )
+                self.result_cache = build_result_cache(model_source)
+                span.set_attribute("model.batching.enabled", settings.BATCH_ENABLED)
+                span.set_attribute("model.cache.backend", settings.CACHE_BACKEND if self.result_cache else "none")
                 span.set_attribute("model.config.id2label", str(self.ner_pipeline.model.config.id2label))
                 span.set_attribute("model.config.label2id", str(self.ner_pipeline.model.config.label2id))
             except Exception as e:
@@ -57,125 +218,345 @@ class ModelService:
                 )
 
     def is_ready(self) -> bool:
-        return self.model_initialized
+        return self.model_initialized and self.warmed_up
 
-    def detect_text(self, data: DetectRequest) -> DetectionResponse:
-        with self.tracer.start_as_current_span("pii_detection") as span:
+    def warm_up(self, lengths: List[int]):
+        """Run one inference per sequence length before taking traffic.
+
+        Goes through the batch scheduler and window splitting like a real
+        request but bypasses the result cache, so the first user does not
+        pay for lazy allocations and kernel selection.
+        """
+        with self.tracer.start_as_current_span("pii_model_warmup") as span:
+            start_time = time.perf_counter()
+            sentence = "My name is Jane Doe, email jane.doe@example.com, phone 555-123-4567. "
+            for length in lengths:
+                text = (sentence * (length // len(sentence) + 1))[:length]
+                self._infer(text)
+
+            warmup_time_ms = (time.perf_counter() - start_time) * 1000
+            MODEL_WARMUP_SECONDS.set(warmup_time_ms / 1000)
+            span.set_attribute("warmup.lengths", str(lengths))
+            span.set_attribute("warmup.time_ms", warmup_time_ms)
+            self.warmed_up = True
+            logger.info(f"Model warm-up finished in {warmup_time_ms:.0f} ms")
+
+    def close(self):
+        if self.batch_scheduler is not None:
+            self.batch_scheduler.close()
+
+    def _split_text(self, text: str) -> List[Window]:
+        # Leave room for [CLS]/[SEP], which the pipeline adds to every window
+        window_tokens = settings.CHUNK_WINDOW_TOKENS - 2
+        # Texts this short cannot exceed one window, so skip tokenization
+        if len(text) <= window_tokens // 2:
+            return [(0, len(text))]
+        encoding = self.ner_pipeline.tokenizer(
+            text, add_special_tokens=False, return_offsets_mapping=True
+        )
+        return split_windows(
+            encoding["offset_mapping"], len(text), window_tokens, settings.CHUNK_OVERLAP_TOKENS
+        )
+
+    def _run_ner(self, text: str) -> list:
+        if self.result_cache is None:
+            return self._infer(text)
+
+        preds = self.result_cache.get(text)
+        trace.get_current_span().set_attribute("ner.cache.hit", preds is not None)
+        if preds is None:
+            preds = self.result_cache.put(text, self._infer(text))
+        return preds
+
+    def _infer(self, text: str) -> list:
+        windows = self._split_text(text)
+        window_texts = [text[start:end] for start, end in windows]
+
+        span = trace.get_current_span()
+        span.set_attribute("ner.chunk.count", len(windows))
+        span.set_attribute("ner.chunk.window_tokens", settings.CHUNK_WINDOW_TOKENS)
+        span.set_attribute("ner.chunk.overlap_tokens", settings.CHUNK_OVERLAP_TOKENS)
+
+        if self.batch_scheduler is not None:
+            # Windows are queued individually so they batch with other requests
+            futures = [self.batch_scheduler.submit(window) for window in window_texts]
+            window_preds = [future.result() for future in futures]
+        elif len(window_texts) == 1:
+            window_preds = [self.ner_pipeline(window_texts[0])]
+        else:
+            window_preds = self.ner_pipeline(window_texts, batch_size=settings.BATCH_MAX_SIZE)
+        return merge_window_predictions(windows, window_preds)
+
+    @staticmethod
+    def _to_entities(raw_preds: list) -> List[Entity]:
+        return [
+            Entity(
+                entity_group=pred["entity_group"],
+                score=pred["score"],
+                word=pred["word"],
+                start=pred["start"],
+                end=pred["end"]
+            )
+            for pred in raw_preds
+        ]
+
+    @staticmethod
+    def _mask_entities(text: str, entities: list) -> str:
+        masked_text = text
+        for ent in sorted(entities, key=lambda x: x["start"], reverse=True):
+            label = ent.get("entity_group", ent.get("entity", "PII"))
+
+            prefix = "" if (ent["start"] > 0 and masked_text[ent["start"]-1].isspace()) else " "
+            suffix = "" if (ent["end"] < len(masked_text) and masked_text[ent["end"]].isspace()) else " "
+
+            replacement = f"{prefix}[{label}]{suffix}"
+            masked_text = masked_text[:ent["start"]] + replacement + masked_text[ent["end"]:]
+        return masked_text
+
+    def _run_ner_bulk(self, texts: List[str]) -> List[Union[list, Exception]]:
+        if self.result_cache is None:
+            return self._infer_bulk(texts)
+
+        results: List[Union[list, Exception, None]] = [self.result_cache.get(text) for text in texts]
+        misses = [i for i, result in enumerate(results) if result is None]
+        trace.get_current_span().set_attribute("ner.cache.hits", len(texts) - len(misses))
+        for i, preds in zip(misses, self._infer_bulk([texts[i] for i in misses])):
+            results[i] = preds if isinstance(preds, Exception) else self.result_cache.put(texts[i], preds)
+        return results
+
+    def _infer_bulk(self, texts: List[str]) -> List[Union[list, Exception]]:
+        """Run texts through the pipeline in ``BULK_CHUNK_SIZE`` chunks.
+
+        Long texts are split into windows first and windows from all texts
+        are batched together. Returns one prediction list per text, or the
+        exception raised for that text, so a single bad document does not
+        fail the whole call.
+        """
+        doc_windows = [self._split_text(text) for text in texts]
+        flat = [
+            (doc, text[start:end])
+            for doc, (text, windows) in enumerate(zip(texts, doc_windows))
+            for start, end in windows
+        ]
+        trace.get_current_span().set_attribute("ner.chunk.count", len(flat))
+
+        chunk_size = max(1, settings.BULK_CHUNK_SIZE)
+        flat_preds: List[Union[list, Exception]] = []
+        for i in range(0, len(flat), chunk_size):
+            chunk = [window for _, window in flat[i:i + chunk_size]]
+            try:
+                flat_preds.extend(self.ner_pipeline(chunk, batch_size=len(chunk)))
+            except Exception:
+                # Isolate the failing window(s) by retrying one at a time
+                for window in chunk:
+                    try:
+                        flat_preds.append(self.ner_pipeline(window))
+                    except Exception as e:
+                        flat_preds.append(e)
+
+        per_doc: List[list] = [[] for _ in texts]
+        for (doc, _), preds in zip(flat, flat_preds):
+            per_doc[doc].append(preds)
+
+        results: List[Union[list, Exception]] = []
+        for windows, preds in zip(doc_windows, per_doc):
+            error = next((p for p in preds if isinstance(p, Exception)), None)
+            results.append(error if error is not None else merge_window_predictions(windows, preds))
+        return results
+
+    def _process_batch(self, documents: List[BatchDocument], span) -> List[Union[list, Exception, None]]:
+        total_chars = sum(len(doc.text) for doc in documents)
+        span.set_attribute("batch.documents", len(documents))
+        span.set_attribute("batch.total_chars", total_chars)
+
+        if len(documents) > settings.BULK_MAX_DOCUMENTS:
+            span.set_attribute("batch.error", "too_many_documents")
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Batch exceeds {settings.BULK_MAX_DOCUMENTS} documents"
+            )
+        if total_chars > settings.BULK_MAX_TOTAL_CHARS:
+            span.set_attribute("batch.error", "too_many_characters")
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Batch exceeds {settings.BULK_MAX_TOTAL_CHARS} total characters"
+            )
+
+        # Empty documents get None and are reported per document
+        valid = [i for i, doc in enumerate(documents) if doc.text.strip()]
+        outputs: List[Union[list, Exception, None]] = [None] * len(documents)
+        with self.tracer.start_as_current_span("ner_pipeline_run") as model_span:
+            preds = self._run_ner_bulk([documents[i].text for i in valid])
+            model_span.set_attribute("ner.batch.chunk_size", settings.BULK_CHUNK_SIZE)
+        for i, pred in zip(valid, preds):
+            outputs[i] = pred
+
+        span.set_attribute("batch.empty_documents", len(documents) - len(valid))
+        span.set_attribute("batch.failed_documents", sum(isinstance(o, Exception) for o in outputs))
+        return outputs
+
+    @staticmethod
+    def _batch_error(output: Union[Exception, None]) -> str:
+        if output is None:
+            return "Input text cannot be empty"
+        logger.error(f"NER pipeline failed for batch document: {str(output)}")
+        return "Internal error while running NER"
+
+    def analyze(self, data: AnalyzeRequest, operation: str = "analysis") -> AnalyzeResponse:
+        """Run NER once and return both the entities and the masked text.
+
+        ``operation`` only names the span and its attributes, so detection
+        and masking keep their own traces while sharing a single inference.
+        """
+        with self.tracer.start_as_current_span(f"pii_{operation}") as span:
             start_time = time.process_time()
-            span.set_attribute("detection.input.text_length", len(data.text.strip()))
-            span.set_attribute("detection.timestamp", datetime.now(timezone.utc).isoformat())
+            span.set_attribute(f"{operation}.input.text_length", len(data.text.strip()))
+            span.set_attribute(f"{operation}.timestamp", datetime.now(timezone.utc).isoformat())
 
             try:
                 if not data.text.strip():
-                    span.set_attribute("detection.error", "empty_text")
-                    span.set_attribute("detection.error.expected", "non_empty_string")
-                    span.set_attribute("detection.error.actual", f"{data.text.strip()}_character")
+                    span.set_attribute(f"{operation}.error", "empty_text")
+                    span.set_attribute(f"{operation}.error.expected", "non_empty_string")
+                    span.set_attribute(f"{operation}.error.actual", f"{len(data.text.strip())}_character")
                     span.set_status(Status(StatusCode.ERROR, "Invalid empty input text"))
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail="Input text cannot be empty"
                     )
-                
+
                 with self.tracer.start_as_current_span("ner_pipeline_run") as model_span:
-                    raw_preds = self.ner_pipeline(data.text)
+                    raw_preds = self._run_ner(data.text)
                     model_span.set_attribute("ner.prediction.count", len(raw_preds))
 
-                entities = [
-                    Entity(
-                        entity_group=pred["entity_group"],
-                        score=pred["score"],
-                        word=pred["word"],
-                        start=pred["start"],
-                        end=pred["end"]
-                    )
-                    for pred in raw_preds
-                ]
-                
+                entities = self._to_entities(raw_preds)
+                masked_text = self._mask_entities(data.text, raw_preds)
+
                 processing_time_ms = (time.process_time() - start_time) * 1000
-                span.set_attribute("detection.processing_time_ms", processing_time_ms)
-                span.set_attribute("detection.success", True)
-                
-                logger.info(f"Detected {len(entities)} entities in text")
-                return DetectionResponse(text=data.text, entities=entities)
+                span.set_attribute(f"{operation}.processing_time_ms", processing_time_ms)
+                span.set_attribute(f"{operation}.success", True)
+
+                logger.info(f"Analyzed text, found {len(entities)} entities")
+                return AnalyzeResponse(
+                    text=data.text,
+                    entities=entities,
+                    masked_text=masked_text,
+                    processing_time_ms=processing_time_ms
+                )
+
             except HTTPException as e:
-                logger.exception(f"NER pipeline failed in pipeline: {str(e)}")
-                
+                logger.exception(f"PII {operation} failed in pipeline: {str(e)}")
+
                 span.record_exception(e)
-                span.set_status(Status(StatusCode.ERROR), str(e.detail))
-                span.set_attribute("detection.success", False)
+                span.set_status(Status(StatusCode.ERROR, str(e.detail)))
+                span.set_attribute(f"{operation}.success", False)
                 raise e
-            
+
             except Exception as e:
-                logger.exception(f"NER pipeline failed: {str(e)}")
+                logger.exception(f"PII {operation} failed: {str(e)}")
                 processing_time_ms = (time.process_time() - start_time) * 1000
 
                 span.record_exception(e)
                 span.set_status(Status(StatusCode.ERROR, str(e)))
-                span.set_attribute("detection.success", False)
-                span.set_attribute("detection.processing_time_ms", processing_time_ms)
+                span.set_attribute(f"{operation}.success", False)
+                span.set_attribute(f"{operation}.processing_time_ms", processing_time_ms)
 
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Internal error while running NER: {str(e)}"
+                    detail=f"Internal error during PII {operation}"
                 )
 
+    def detect_text(self, data: DetectRequest) -> DetectionResponse:
+        result = self.analyze(data, operation="detection")
+        return DetectionResponse(text=result.text, entities=result.entities)
+
     def mask_text(self, data: MaskRequest) -> MaskResponse:
-        with self.tracer.start_as_current_span("pii_masking") as span:
-            start_time = time.process_time()
-            span.set_attribute("masking.input.text_length", len(data.text.strip()))
-            span.set_attribute("masking.timestamp", datetime.now(timezone.utc).isoformat())
+        result = self.analyze(data, operation="masking")
+        return MaskResponse(original_text=result.text, masked_text=result.masked_text)
 
+    def detect_batch(self, data: BatchDetectRequest) -> BatchDetectResponse:
+        with self.tracer.start_as_current_span("pii_batch_detection") as span:
+            start_time = time.process_time()
             try:
-                if not data.text.strip():
-                    span.set_attribute("masking.error", "empty_text")
-                    span.set_attribute("masking.error.expected", "non_empty_string")
-                    span.set_attribute("masking.error.actual", f"{len(data.text.strip())}_character")
-                    span.set_status(Status(StatusCode.ERROR, "Invalid empty input text"))
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Input text cannot be empty"
-                    )
-                
-                # Trace pipeline run
-                with self.tracer.start_as_current_span("ner_pipeline_run") as model_span:
-                    entities = self.ner_pipeline(data.text)
-                    model_span.set_attribute("ner.prediction.count", len(entities))
+                outputs = self._process_batch(data.documents, span)
+                results = [
+                    BatchDetectResult(id=doc.id, entities=self._to_entities(output))
+                    if isinstance(output, list)
+                    else BatchDetectResult(id=doc.id, error=self._batch_error(output))
+                    for doc, output in zip(data.documents, outputs)
+                ]
 
-                masked_text = data.text
-                for ent in sorted(entities, key=lambda x: x["start"], reverse=True):
-                    label = ent.get("entity_group", ent.get("entity", "PII"))
+                processing_time_ms = (time.process_time() - start_time) * 1000
+                span.set_attribute("batch.processing_time_ms", processing_time_ms)
+                span.set_attribute("batch.success", True)
 
-                    prefix = "" if (ent["start"] > 0 and masked_text[ent["start"]-1].isspace()) else " "
-                    suffix = "" if (ent["end"] < len(masked_text) and masked_text[ent["end"]].isspace()) else " "
+                logger.info(f"Batch detection processed {len(results)} documents")
+                return BatchDetectResponse(results=results)
 
-                    replacement = f"{prefix}[{label}]{suffix}"
-                    masked_text = masked_text[:ent["start"]] + replacement + masked_text[ent["end"]:]
+            except HTTPException as e:
+                span.record_exception(e)
+                span.set_status(Status(StatusCode.ERROR, str(e.detail)))
+                span.set_attribute("batch.success", False)
+                raise e
+
+            except Exception as e:
+                logger.exception(f"Batch detection failed: {str(e)}")
+                span.record_exception(e)
+                span.set_status(Status(StatusCode.ERROR, str(e)))
+                span.set_attribute("batch.success", False)
+
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Internal error while running batch NER"
+                )
+
+    def mask_batch(self, data: BatchMaskRequest) -> BatchMaskResponse:
+        with self.tracer.start_as_current_span("pii_batch_masking") as span:
+            start_time = time.process_time()
+            try:
+                outputs = self._process_batch(data.documents, span)
+                results = [
+                    BatchMaskResult(id=doc.id, masked_text=self._mask_entities(doc.text, output))
+                    if isinstance(output, list)
+                    else BatchMaskResult(id=doc.id, error=self._batch_error(output))
+                    for doc, output in zip(data.documents, outputs)
+                ]
 
                 processing_time_ms = (time.process_time() - start_time) * 1000
-                span.set_attribute("masking.processing_time_ms", processing_time_ms)
-                span.set_attribute("masking.success", True)
+                span.set_attribute("batch.processing_time_ms", processing_time_ms)
+                span.set_attribute("batch.success", True)
 
-                logger.info(f"Masking successful, replaced {len(entities)} entities")
-                return MaskResponse(original_text=data.text, masked_text=masked_text)
+                logger.info(f"Batch masking processed {len(results)} documents")
+                return BatchMaskResponse(results=results)
 
             except HTTPException as e:
-                logger.exception(f"Masking failed in pipeline: {str(e)}")
-                
                 span.record_exception(e)
-                span.set_status(Status(StatusCode.ERROR), str(e.detail))
-                span.set_attribute("masking.success", False)
+                span.set_status(Status(StatusCode.ERROR, str(e.detail)))
+                span.set_attribute("batch.success", False)
                 raise e
-            
-            except Exception as e:
-                logger.exception(f"Masking failed in pipeline: {str(e)}")
-                processing_time_ms = (time.process_time() - start_time) * 1000
 
+            except Exception as e:
+                logger.exception(f"Batch masking failed: {str(e)}")
                 span.record_exception(e)
                 span.set_status(Status(StatusCode.ERROR, str(e)))
-                span.set_attribute("masking.success", False)
-                span.set_attribute("masking.processing_time_ms", processing_time_ms)
+                span.set_attribute("batch.success", False)
 
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Internal error while masking text"
-                )
\ No newline at end of file
+                    detail="Internal error while masking batch"
+                )
+
+    def mask_texts(self, texts: List[str]) -> List[Union[str, Exception]]:
+        """Mask a list of raw texts for the streaming paths.
+
+        Blank texts are returned unchanged; a text whose inference fails
+        gets its exception instead of a masked string.
+        """
+        with self.tracer.start_as_current_span("pii_stream_masking") as span:
+            span.set_attribute("stream.batch.texts", len(texts))
+            valid = [i for i, text in enumerate(texts) if text.strip()]
+            outputs: List[Union[str, Exception]] = list(texts)
+            with self.tracer.start_as_current_span("ner_pipeline_run"):
+                preds = self._run_ner_bulk([texts[i] for i in valid])
+            for i, pred in zip(valid, preds):
+                outputs[i] = pred if isinstance(pred, Exception) else self._mask_entities(texts[i], pred)
+            return outputs
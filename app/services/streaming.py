@@ -0,0 +1,188 @@
+import argparse
+import json
+import logging
+import os
+import time
+from typing import AsyncIterator, Iterable, Iterator, List, Optional
+from core.config import settings
+from utils.metrics import STREAM_RECORDS, STREAM_BYTES
+
+
+logger = logging.getLogger(__name__)
+
+
+def redact_lines(model_service, lines: List[bytes], fields: List[str]) -> bytes:
+    """Redact ``fields`` of a batch of NDJSON lines in one model pass.
+
+    Output lines keep the input order. A line that is not a JSON object
+    becomes an ``{"_error": ...}`` record in its place so the output stays
+    aligned with the input; a field that fails to mask is nulled rather
+    than passed through unredacted.
+    """
+    records, texts, slots = [], [], []
+    for line in lines:
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("record is not a JSON object")
+        except ValueError as e:
+            records.append({"_error": f"Invalid JSON record: {str(e)}"})
+            continue
+        for field in fields:
+            if isinstance(record.get(field), str):
+                slots.append((len(records), field))
+                texts.append(record[field])
+        records.append(record)
+
+    masked = model_service.mask_texts(texts) if texts else []
+    for (index, field), value in zip(slots, masked):
+        if isinstance(value, Exception):
+            records[index][field] = None
+            records[index]["_error"] = "Internal error while masking record"
+        else:
+            records[index][field] = value
+
+    return b"".join(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n" for record in records)
+
+
+class ThroughputReporter:
+    """Counts records and bytes, logging the rates every ``interval`` seconds."""
+
+    def __init__(self, source: str, interval: float = 10.0):
+        self.source = source
+        self.interval = interval
+        self.records = 0
+        self.bytes = 0
+        self.started_at = time.monotonic()
+        self._last_log = self.started_at
+
+    def add(self, records: int, size: int):
+        self.records += records
+        self.bytes += size
+        STREAM_RECORDS.labels(source=self.source).inc(records)
+        STREAM_BYTES.labels(source=self.source).inc(size)
+        if time.monotonic() - self._last_log >= self.interval:
+            self.log()
+
+    def log(self, final: bool = False):
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        self._last_log = time.monotonic()
+        logger.info(
+            f"{'Finished' if final else 'Progress'}: {self.records} records, "
+            f"{self.records / elapsed:.1f} records/s, {self.bytes / elapsed / 1024:.1f} KiB/s"
+        )
+
+
+def _split_batches(lines: Iterable[bytes], batch_size: int, skip: int = 0) -> Iterator[List[bytes]]:
+    batch, seen = [], 0
+    for line in lines:
+        if not line.strip():
+            continue
+        seen += 1
+        if seen <= skip:
+            continue
+        batch.append(line)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def iter_line_batches(chunks: AsyncIterator[bytes], batch_size: int,
+                            skip: int = 0) -> AsyncIterator[List[bytes]]:
+    """Group an async byte stream into batches of NDJSON lines.
+
+    Only the current partial line and one batch are held in memory, and
+    the first ``skip`` records are dropped without being parsed.
+    """
+    buffer, batch, seen = b"", [], 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if not line.strip():
+                continue
+            seen += 1
+            if seen <= skip:
+                continue
+            batch.append(line)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if buffer.strip() and seen + 1 > skip:
+        batch.append(buffer)
+    if batch:
+        yield batch
+
+
+def _read_checkpoint(path: str) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_checkpoint(path: str, records: int, size: int):
+    # Write-then-rename so a crash never leaves a half-written checkpoint
+    with open(path + ".tmp", "w") as f:
+        json.dump({"records": records, "bytes": size}, f)
+    os.replace(path + ".tmp", path)
+
+
+def redact_file(model_service, input_path: str, output_path: str, fields: List[str],
+                batch_size: int, resume: bool = False) -> int:
+    """Redact a JSONL file into ``output_path`` with constant memory.
+
+    After every batch the number of records and output bytes written is
+    checkpointed to ``<output>.checkpoint``; with ``resume`` the output is
+    truncated back to the checkpoint and processing continues from there.
+    """
+    checkpoint_path = output_path + ".checkpoint"
+    checkpoint = _read_checkpoint(checkpoint_path) if resume else None
+    done_records = checkpoint["records"] if checkpoint else 0
+    done_bytes = checkpoint["bytes"] if checkpoint else 0
+    if checkpoint:
+        logger.info(f"Resuming after record {done_records}")
+
+    reporter = ThroughputReporter("cli")
+    with open(input_path, "rb") as src, open(output_path, "ab" if checkpoint else "wb") as dst:
+        dst.truncate(done_bytes)
+        for batch in _split_batches(src, batch_size, skip=done_records):
+            output = redact_lines(model_service, batch, fields)
+            dst.write(output)
+            dst.flush()
+            done_records += len(batch)
+            done_bytes += len(output)
+            _write_checkpoint(checkpoint_path, done_records, done_bytes)
+            reporter.add(len(batch), sum(len(line) for line in batch))
+    reporter.log(final=True)
+    return done_records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Redact PII from a JSONL file offline")
+    parser.add_argument('--input', type=str, required=True, help="JSONL file to redact")
+    parser.add_argument('--output', type=str, required=True, help="Where to write redacted JSONL")
+    parser.add_argument(
+        '--fields',
+        type=str,
+        nargs="+",
+        default=["text"],
+        help="String fields of each record to redact"
+    )
+    parser.add_argument('--batch-size', type=int, default=settings.STREAM_BATCH_SIZE)
+    parser.add_argument(
+        '--resume',
+        action="store_true",
+        help="Continue from the last checkpoint instead of starting over"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    from services.model_service import ModelService
+    model_service = ModelService()
+    redact_file(model_service, args.input, args.output, args.fields, args.batch_size, args.resume)
+
+if __name__ == "__main__":
+    main()
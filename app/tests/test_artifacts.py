@@ -0,0 +1,38 @@
+import os
+import shutil
+from core.config import settings
+from services.artifacts import ArtifactIntegrityError, resolve_artifact, snapshot_model
+from services.backends import load_pipeline
+import pytest
+
+@pytest.fixture(scope="module")
+def artifact(tmp_path_factory):
+    root = tmp_path_factory.mktemp("artifacts")
+    return root, snapshot_model(settings.MODEL_REPO_ID, str(root))
+
+# The snapshot is versioned, uses safetensors and resolves through LATEST
+def test_snapshot_resolves_latest(artifact):
+    root, version_dir = artifact
+    model_dir = os.path.dirname(version_dir)
+    assert resolve_artifact(model_dir) == version_dir
+    assert os.path.exists(os.path.join(version_dir, "model.safetensors"))
+
+# A resolved artifact loads without touching the network
+def test_offline_load(artifact):
+    _, version_dir = artifact
+    pipe = load_pipeline("torch-fp32", resolve_artifact(version_dir), local_files_only=True)
+    assert isinstance(pipe("John Doe, email john.doe@gmail.com"), list)
+
+# Tampered weights are rejected before loading
+def test_integrity_check(artifact, tmp_path):
+    _, version_dir = artifact
+    tampered = tmp_path / "tampered"
+    shutil.copytree(version_dir, tampered)
+    weights = tampered / "model.safetensors"
+    data = bytearray(weights.read_bytes())
+    data[-1] ^= 0xFF
+    weights.write_bytes(bytes(data))
+    with pytest.raises(ArtifactIntegrityError):
+        resolve_artifact(str(tampered))
+    # Size-only checks are cheaper but miss same-size corruption
+    assert resolve_artifact(str(tampered), verify_hashes=False) == str(tampered)
@@ -0,0 +1,50 @@
+import os
+from core.config import settings
+from services import backends
+import pytest
+
+TEXTS = [
+    "Aiguo Wagner, phone 0666 335 6493, email aiguo_wagner2235@outlook.gov, LinkedIn @aiguo.wagner",
+    "Jane Smith lives at 40404 Jeremy Brook, username @janesmith",
+    "Contact me at 0777 444 9999 or email test.user@test.com",
+    "Hello, how are you today?",
+]
+
+# Minimum entity F1 between a backend and the torch-fp32 reference
+MIN_AGREEMENT = 0.9
+
+def entity_set(pipe, text):
+    return {(p["entity_group"], p["start"], p["end"]) for p in pipe(text)}
+
+def agreement(reference, candidate):
+    if not reference and not candidate:
+        return 1.0
+    overlap = len(reference & candidate)
+    return 2 * overlap / (len(reference) + len(candidate))
+
+@pytest.fixture(scope="module")
+def reference_pipeline():
+    return backends.load_pipeline("torch-fp32")
+
+def candidate_backends():
+    yield "torch-dynamic-int8"
+    onnx_ready = (
+        backends.ORTModelForTokenClassification is not None
+        and os.path.exists(os.path.join(settings.ONNX_MODEL_DIR, settings.ONNX_FILE_NAME))
+    )
+    yield pytest.param(
+        "onnxruntime",
+        marks=pytest.mark.skipif(not onnx_ready, reason="ONNX artifact not exported")
+    )
+
+# Every backend must produce (nearly) the same entities as torch-fp32
+@pytest.mark.parametrize("backend", candidate_backends())
+def test_backend_parity(reference_pipeline, backend):
+    candidate = backends.load_pipeline(backend)
+    for text in TEXTS:
+        score = agreement(entity_set(reference_pipeline, text), entity_set(candidate, text))
+        assert score >= MIN_AGREEMENT, f"{backend} disagrees with torch-fp32 on {text!r}"
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        backends.load_model("tensorrt", settings.MODEL_REPO_ID)
@@ -0,0 +1,49 @@
+from concurrent.futures import ThreadPoolExecutor
+from services.model_service import BatchScheduler
+import pytest
+
+
+class FakePipeline:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, batch_size=None):
+        self.calls.append(list(texts))
+        return [[{"text": t}] for t in texts]
+
+@pytest.fixture
+def fake_pipeline():
+    return FakePipeline()
+
+# Concurrent submissions are grouped and every caller gets its own result back
+def test_batches_concurrent_requests(fake_pipeline):
+    scheduler = BatchScheduler(fake_pipeline, max_wait_ms=50, max_batch_size=8, max_batch_tokens=10_000)
+    texts = [f"text {i}" for i in range(16)]
+    with ThreadPoolExecutor(16) as ex:
+        results = list(ex.map(scheduler, texts))
+    scheduler.close()
+
+    assert [r[0]["text"] for r in results] == texts
+    assert len(fake_pipeline.calls) < len(texts)
+    assert all(len(call) <= 8 for call in fake_pipeline.calls)
+
+# A batch is closed before its padded token count exceeds the budget
+def test_respects_token_budget(fake_pipeline):
+    scheduler = BatchScheduler(fake_pipeline, max_wait_ms=50, max_batch_size=64, max_batch_tokens=100)
+    text = "x" * 160  # ~42 tokens each, so at most two fit in one batch
+    with ThreadPoolExecutor(6) as ex:
+        list(ex.map(scheduler, [text] * 6))
+    scheduler.close()
+
+    assert all(len(call) <= 2 for call in fake_pipeline.calls)
+    assert sum(len(call) for call in fake_pipeline.calls) == 6
+
+# Pipeline errors are propagated to every waiting caller
+def test_propagates_pipeline_errors():
+    def failing(texts, batch_size=None):
+        raise RuntimeError("boom")
+
+    scheduler = BatchScheduler(failing, max_wait_ms=1, max_batch_size=4, max_batch_tokens=1000)
+    with pytest.raises(RuntimeError, match="boom"):
+        scheduler("some text")
+    scheduler.close()
@@ -0,0 +1,44 @@
+from services.cache import MemoryResultCache
+import time
+
+TEXT = "Email john.doe@gmail.com now"
+PREDS = [{"entity_group": "EMAIL", "score": 0.99, "word": "john.doe@gmail.com", "start": 6, "end": 24}]
+
+# A stored result is returned on the next lookup of the same text
+def test_hit_after_put():
+    cache = MemoryResultCache("model|first|0.8", max_bytes=1 << 20, ttl_seconds=60)
+    assert cache.get(TEXT) is None
+    cache.put(TEXT, PREDS)
+    assert cache.get(TEXT) == PREDS
+
+# Texts that only differ in surrounding whitespace share an entry with shifted offsets
+def test_whitespace_normalization_shifts_offsets():
+    cache = MemoryResultCache("model|first|0.8", max_bytes=1 << 20, ttl_seconds=60)
+    cache.put(TEXT, PREDS)
+    hit = cache.get("   " + TEXT + "\n")
+    assert (hit[0]["start"], hit[0]["end"]) == (9, 27)
+    assert hit[0]["word"] == "john.doe@gmail.com"
+
+# Neither the raw text nor the matched words are kept in the cache
+def test_no_raw_pii_stored():
+    cache = MemoryResultCache("model|first|0.8", max_bytes=1 << 20, ttl_seconds=60)
+    cache.put(TEXT, PREDS)
+    stored = repr(list(cache._entries.items()))
+    assert "john.doe" not in stored and "Email" not in stored
+
+# Least recently used entries are evicted once the memory budget is exceeded
+def test_lru_eviction_by_size():
+    cache = MemoryResultCache("m", max_bytes=1000, ttl_seconds=60)
+    for i in range(20):
+        cache.put(f"text {i}", PREDS)
+    assert cache.size_bytes <= 1000
+    assert cache.get("text 19") is not None
+    assert cache.get("text 0") is None
+
+# Entries expire after the TTL
+def test_ttl_expiry():
+    cache = MemoryResultCache("m", max_bytes=1 << 20, ttl_seconds=0.01)
+    cache.put(TEXT, PREDS)
+    time.sleep(0.02)
+    assert cache.get(TEXT) is None
+    assert len(cache) == 0
@@ -0,0 +1,32 @@
+from services.chunking import split_windows, merge_window_predictions
+
+
+def char_offsets(text):
+    # One token per character is enough to exercise the window arithmetic
+    return [(i, i + 1) for i in range(len(text))]
+
+# Short documents stay in a single window
+def test_single_window():
+    text = "short text"
+    assert split_windows(char_offsets(text), len(text), 32, 8) == [(0, len(text))]
+
+# Windows cover the whole document and overlap by the configured amount
+def test_windows_cover_document_with_overlap():
+    text = "x" * 100
+    windows = split_windows(char_offsets(text), len(text), 32, 8)
+    assert windows[0][0] == 0
+    assert windows[-1][1] == len(text)
+    for (_, prev_end), (start, end) in zip(windows, windows[1:]):
+        assert prev_end - start == 8
+        assert end - start <= 32
+
+# Predictions in the overlap are kept once with document-level offsets
+def test_merge_deduplicates_overlap():
+    windows = [(0, 32), (24, 56)]
+    entity = {"entity_group": "EMAIL", "score": 0.9, "word": "a@b.c"}
+    window_preds = [
+        [dict(entity, start=2, end=7), dict(entity, start=26, end=31)],
+        [dict(entity, start=2, end=7), dict(entity, start=20, end=25)],
+    ]
+    merged = merge_window_predictions(windows, window_preds)
+    assert [(p["start"], p["end"]) for p in merged] == [(2, 7), (26, 31), (44, 49)]
@@ -0,0 +1,65 @@
+import asyncio
+import threading
+from fastapi import HTTPException
+from starlette.requests import Request
+from services.executor import InferenceExecutor
+import pytest
+
+
+def make_request(headers=None):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/pii/detect",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+    }
+    return Request(scope, receive)
+
+# Calls run on the executor and their result is returned
+def test_runs_inference():
+    executor = InferenceExecutor(workers=2, queue_depth=2)
+    result = asyncio.run(executor.run(make_request(), lambda x: x * 2, 21))
+    executor.shutdown()
+    assert result == 42
+
+# Requests beyond workers + queue depth are rejected fast with Retry-After
+def test_rejects_when_queue_full():
+    executor = InferenceExecutor(workers=1, queue_depth=1)
+    release = threading.Event()
+
+    async def scenario():
+        blocked = [asyncio.ensure_future(executor.run(make_request(), release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(HTTPException) as exc:
+            await executor.run(make_request(), lambda: None)
+        release.set()
+        await asyncio.gather(*blocked)
+        return exc.value
+
+    error = asyncio.run(scenario())
+    executor.shutdown()
+    assert error.status_code == 429
+    assert "Retry-After" in error.headers
+
+# Queued work is dropped once the client deadline passes
+def test_deadline_cancels_queued_work():
+    executor = InferenceExecutor(workers=1, queue_depth=4)
+    release = threading.Event()
+    ran = []
+
+    async def scenario():
+        blocker = asyncio.ensure_future(executor.run(make_request(), release.wait))
+        await asyncio.sleep(0.05)
+        with pytest.raises(HTTPException) as exc:
+            await executor.run(make_request({"X-Request-Timeout-Ms": "50"}), lambda: ran.append(1))
+        release.set()
+        await blocker
+        return exc.value
+
+    error = asyncio.run(scenario())
+    executor.shutdown()
+    assert error.status_code == 504
+    assert ran == []
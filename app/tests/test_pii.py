@@ -3,11 +3,16 @@ from fastapi.testclient import TestClient
 from main import app
 import pytest
 from datetime import datetime
+import time
 
-# Fixture to provide a TestClient instance with module scope
+# Fixture to provide a TestClient instance with module scope, once the model is warmed up
 @pytest.fixture(scope="module")
 def client():
     with TestClient(app) as c:
+        deadline = time.monotonic() + 600
+        while c.get("/pii/health/ready").status_code != 200:
+            assert time.monotonic() < deadline, "model did not become ready"
+            time.sleep(0.1)
         yield c
 
 # Test health endpoint
@@ -21,6 +26,23 @@ def test_health_check(client):
     assert "timestamp" in data
     assert isinstance(datetime.fromisoformat(data["timestamp"]), datetime)
 
+# Test readiness probe once warm-up has finished
+def test_readiness_check(client):
+    response = client.get("/pii/health/ready")
+    assert response.status_code == 200
+    assert response.json() == {"ready": True, "model_state": "ready"}
+    assert client.get("/pii/health").json()["ready"] is True
+
+# Test inference endpoints fail fast with 503 while the model is not ready
+def test_not_ready_returns_503(client, monkeypatch):
+    from api.routes import pii_router
+    monkeypatch.setattr(pii_router, "_model_service", None)
+    monkeypatch.setattr(pii_router, "_model_state", "loading")
+    response = client.post("/pii/detect", json={"text": "John Doe"})
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+    assert client.get("/pii/health/ready").status_code == 503
+
 # Fixture to provide sample text with PII for testing
 @pytest.fixture(params=[
     "Aiguo Wagner, phone 0666 335 6493, email aiguo_wagner2235@outlook.gov, LinkedIn @aiguo.wagner",
@@ -104,3 +126,81 @@ def test_mask_benign_text(client, text):
     data = response.json()
     assert data["original_text"] == data["masked_text"]
 
+# Test batch detect endpoint returns per-document results and errors
+def test_detect_batch(client):
+    documents = [
+        {"id": "essay-1", "text": "Aiguo Wagner, phone 0666 335 6493, email aiguo_wagner2235@outlook.gov"},
+        {"id": "essay-2", "text": "   "},
+        {"id": "essay-3", "text": "Contact me at 0777 444 9999 or email test.user@test.com"},
+    ]
+    response = client.post("/pii/detect/batch", json={"documents": documents})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["id"] for r in results] == ["essay-1", "essay-2", "essay-3"]
+    assert results[0]["error"] is None and len(results[0]["entities"]) > 0
+    assert results[1]["entities"] is None
+    assert results[1]["error"] == "Input text cannot be empty"
+    assert results[2]["error"] is None and len(results[2]["entities"]) > 0
+
+# Test batch mask endpoint masks every valid document
+def test_mask_batch(client):
+    documents = [
+        {"id": "a", "text": "Call me at 0777 444 9999 or email test.user@test.com"},
+        {"id": "b", "text": ""},
+    ]
+    response = client.post("/pii/mask/batch", json={"documents": documents})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert "[" in results[0]["masked_text"]
+    assert results[1]["error"] == "Input text cannot be empty"
+
+# Test batch endpoints reject calls above the server-side caps
+def test_batch_limits(client):
+    from core.config import settings
+    documents = [{"id": str(i), "text": "hi"} for i in range(settings.BULK_MAX_DOCUMENTS + 1)]
+    response = client.post("/pii/detect/batch", json={"documents": documents})
+    assert response.status_code == 413
+
+    documents = [{"id": "big", "text": "a" * (settings.BULK_MAX_TOTAL_CHARS + 1)}]
+    response = client.post("/pii/mask/batch", json={"documents": documents})
+    assert response.status_code == 413
+
+# Test analyze endpoint returns entities and masked text from one model run
+@pytest.mark.parametrize("text", [
+    "Aiguo Wagner, phone 0666 335 6493, email aiguo_wagner2235@outlook.gov, LinkedIn @aiguo.wagner",
+    "Call me at 0777 444 9999 or email test.user@test.com",
+])
+def test_analyze_pii(client, text):
+    response = client.post("/pii/analyze", json={"text": text})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["text"] == text
+    assert len(data["entities"]) > 0
+    assert any(f"[{ent['entity_group']}]" in data["masked_text"] for ent in data["entities"])
+    assert data["processing_time_ms"] >= 0
+
+# Test analyze endpoint with invalid inputs
+@pytest.mark.parametrize("text", ["", "   "])
+def test_analyze_invalid_input(client, text):
+    response = client.post("/pii/analyze", json={"text": text})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Input text cannot be empty"
+
+# Test streaming NDJSON redaction keeps order, masks fields and supports offsets
+def test_mask_stream(client):
+    import json
+    records = [
+        {"id": 1, "body": "Call me at 0777 444 9999 or email test.user@test.com"},
+        {"id": 2, "body": "Aiguo Wagner, phone 0666 335 6493"},
+        {"id": 3, "body": "Jane Smith lives at 40404 Jeremy Brook, username @janesmith"},
+    ]
+    payload = "\n".join(json.dumps(r) for r in records) + "\nnot json\n"
+    response = client.post("/pii/mask/stream?fields=body", content=payload)
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line.get("id") for line in lines] == [1, 2, 3, None]
+    assert all("[" in line["body"] for line in lines[:3])
+    assert "_error" in lines[3]
+
+    response = client.post("/pii/mask/stream?fields=body&offset=2", content=payload)
+    assert [json.loads(line).get("id") for line in response.text.splitlines()] == [3, None]
@@ -0,0 +1,40 @@
+import json
+from services.streaming import redact_file
+
+
+class FakeModelService:
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+
+    def mask_texts(self, texts):
+        if self.fail_on is not None and any(self.fail_on in text for text in texts):
+            raise RuntimeError("crash")
+        return [text.replace("John", "[NAME_STUDENT]") for text in texts]
+
+def write_jsonl(path, n):
+    with open(path, "w") as f:
+        for i in range(n):
+            f.write(json.dumps({"id": i, "text": f"John wrote essay {i}"}) + "\n")
+
+# Every record is redacted and written in input order
+def test_redact_file(tmp_path):
+    src, dst = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_jsonl(src, 10)
+    assert redact_file(FakeModelService(), str(src), str(dst), ["text"], batch_size=3) == 10
+    records = [json.loads(line) for line in dst.read_text().splitlines()]
+    assert [r["id"] for r in records] == list(range(10))
+    assert all(r["text"].startswith("[NAME_STUDENT]") for r in records)
+
+# A crashed run resumes from its checkpoint without duplicating records
+def test_resume_after_crash(tmp_path):
+    src, dst = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_jsonl(src, 10)
+    try:
+        redact_file(FakeModelService(fail_on="essay 7"), str(src), str(dst), ["text"], batch_size=3)
+    except RuntimeError:
+        pass
+    assert json.loads((tmp_path / "out.jsonl.checkpoint").read_text())["records"] == 6
+
+    redact_file(FakeModelService(), str(src), str(dst), ["text"], batch_size=3, resume=True)
+    records = [json.loads(line) for line in dst.read_text().splitlines()]
+    assert [r["id"] for r in records] == list(range(10))
@@ -0,0 +1,79 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+# Registered on the default registry, so they are served by the
+# Prometheus FastAPI Instrumentator on /metrics alongside the HTTP metrics.
+# Under serve.py with several workers, PROMETHEUS_MULTIPROC_DIR is set and
+# the gauges are aggregated across processes with their multiprocess_mode.
+
+BATCH_SIZE = Histogram(
+    "pii_batch_size",
+    "Number of texts padded into one NER forward pass",
+    buckets=(1, 2, 4, 8, 16, 32, 64)
+)
+
+BATCH_QUEUE_WAIT = Histogram(
+    "pii_batch_queue_wait_seconds",
+    "Time a text spent in the batch scheduler queue before its forward pass",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.02, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+
+CACHE_HITS = Counter(
+    "pii_cache_hits_total",
+    "NER result cache hits",
+    ["backend"]
+)
+
+CACHE_MISSES = Counter(
+    "pii_cache_misses_total",
+    "NER result cache misses",
+    ["backend"]
+)
+
+CACHE_EVICTIONS = Counter(
+    "pii_cache_evictions_total",
+    "NER result cache entries evicted for size or expiry",
+    ["backend", "reason"]
+)
+
+MODEL_LOAD_SECONDS = Gauge(
+    "pii_model_load_seconds",
+    "Wall time spent loading the NER pipeline at startup",
+    ["source"],
+    multiprocess_mode="max"
+)
+
+MODEL_WARMUP_SECONDS = Gauge(
+    "pii_model_warmup_seconds",
+    "Wall time spent on warm-up inferences at startup",
+    multiprocess_mode="max"
+)
+
+INFERENCE_QUEUED = Gauge(
+    "pii_inference_queued",
+    "Inference calls admitted but waiting for an executor thread",
+    multiprocess_mode="livesum"
+)
+
+INFERENCE_RUNNING = Gauge(
+    "pii_inference_running",
+    "Inference calls currently running on the executor",
+    multiprocess_mode="livesum"
+)
+
+INFERENCE_REJECTIONS = Counter(
+    "pii_inference_rejections_total",
+    "Inference calls rejected or dropped before completing",
+    ["reason"]
+)
+
+STREAM_RECORDS = Counter(
+    "pii_stream_records_total",
+    "NDJSON records redacted by the streaming endpoint or CLI",
+    ["source"]
+)
+
+STREAM_BYTES = Counter(
+    "pii_stream_bytes_total",
+    "NDJSON input bytes redacted by the streaming endpoint or CLI",
+    ["source"]
+)